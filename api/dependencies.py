@@ -1,8 +1,11 @@
 import logging
+import time
 import httpx
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional
+from fastapi import HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.security import HTTPBearer
+
+from scraper.auth_manager import get_token_exp
 
 logger = logging.getLogger(__name__)
 
@@ -12,34 +15,52 @@ security = HTTPBearer(
     auto_error=False
 )
 
-HEADERS = {
-    "Host": "app.ecourts.gov.in",
-    "User-Agent": "Dalvik/2.1.0 (Linux; U; Android 16; Pixel 7 Build/BP3A.250905.014)",
-    "Accept-Encoding": "gzip",
-    "Accept-Charset": "UTF-8",
-    "Connection": "keep-alive",
-}
+# `security` is only used to document the scheme; get_auth_token parses the header itself.
+# Routes that need a token pass this as `openapi_extra` so Swagger still shows the lock.
+BEARER_AUTH_OPENAPI = {"security": [{security.scheme_name: []}]}
+
+
+async def get_http_client(request: Request) -> httpx.AsyncClient:
+    return request.app.state.http_client
 
 
-def get_http_client() -> httpx.Client:
-    return httpx.Client(headers=HEADERS, timeout=20, follow_redirects=True)
+def add_security_schemes(openapi_schema: dict) -> dict:
+    schemes = openapi_schema.setdefault("components", {}).setdefault("securitySchemes", {})
+    schemes[security.scheme_name] = jsonable_encoder(security.model, by_alias=True, exclude_none=True)
+    return openapi_schema
 
 
-async def get_auth_token(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
-) -> str:
-    if not credentials:
+async def get_auth_token(request: Request) -> str:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authorization required. Use 'Authorization: Bearer <token>' in request header",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    if not credentials.credentials:
+
+    token = token.strip()
+    if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token cannot be empty",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    return credentials.credentials
+
+    # Some lookups are answered from cache without reaching the upstream, so tokens that
+    # are clearly not usable are turned away here rather than by the upstream
+    exp = get_token_exp(token)
+    if token.count(".") != 2 or (exp is not None and exp <= time.time()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token expired or invalid. Generate a new token from /auth/token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return token
+
+
+async def get_client_and_token(request: Request) -> tuple[httpx.AsyncClient, str]:
+    # Neither lookup does I/O, so resolving both in one dependency is cheaper than
+    # two separate Depends() entries (or scheduling them with asyncio.gather)
+    return await get_http_client(request), await get_auth_token(request)
@@ -2,11 +2,12 @@
 Custom exception handlers and utilities for the API.
 """
 
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 import logging
-from typing import Union
+import math
+import os
+from typing import Any, Dict, Optional
 
 from utils.exceptions import (
     UnauthorizedException,
@@ -14,117 +15,78 @@ from utils.exceptions import (
     NotFoundException,
     ValidationException,
     InternalServerErrorException,
-    ConflictException
+    ConflictException,
+    ServiceUnavailableException
 )
 from api.schemas import ErrorResponse
+from api.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
+# Walking tracebacks for every 500 is expensive; opt in with LOG_STACK_TRACES=1
+LOG_STACK_TRACES = os.getenv("LOG_STACK_TRACES") == "1"
+# Upstream error payloads can be huge; only this much of them is echoed back
+MAX_ERROR_DETAIL_LENGTH = 1024
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    """Handle general exceptions."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    error_response = ErrorResponse(
-        code=500,
-        message="Internal server error",
-        details={"error": str(exc)} if str(exc) else None
-    )
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump()
-    )
 
-
-async def unauthorized_exception_handler(request: Request, exc: UnauthorizedException) -> JSONResponse:
-    """Handle unauthorized exceptions."""
-    logger.warning(f"Unauthorized access: {exc}")
-    error_response = ErrorResponse(
-        code=401,
-        message="Authentication failed or token expired",
-        details={"error": str(exc)}
-    )
-    return JSONResponse(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        content=error_response.model_dump()
-    )
+def _template(code: int, message: str) -> Dict[str, Any]:
+    return ErrorResponse(code=code, message=message).model_dump()
 
 
-async def not_found_exception_handler(request: Request, exc: NotFoundException) -> JSONResponse:
-    """Handle not found exceptions."""
-    logger.warning(f"Resource not found: {exc}")
-    error_response = ErrorResponse(
-        code=404,
-        message="Resource not found",
-        details={"error": str(exc)}
-    )
-    return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content=error_response.model_dump()
-    )
+# Error bodies are static apart from `details`, so build them once at import time
+_INTERNAL_ERROR = _template(500, "Internal server error")
+_UNAUTHORIZED = _template(401, "Authentication failed or token expired")
+_NOT_FOUND = _template(404, "Resource not found")
+_BAD_REQUEST = _template(400, "Bad request")
+_VALIDATION_ERROR = _template(422, "Validation error")
+_CONFLICT = _template(409, "Conflict")
+_SERVICE_UNAVAILABLE = _template(503, "Service unavailable")
+_REQUEST_VALIDATION_FAILED = _template(422, "Request validation failed")
 
 
-async def bad_request_exception_handler(request: Request, exc: BadRequestException) -> JSONResponse:
-    """Handle bad request exceptions."""
-    logger.warning(f"Bad request: {exc}")
-    error_response = ErrorResponse(
-        code=400,
-        message="Bad request",
-        details={"error": str(exc)}
-    )
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content=error_response.model_dump()
-    )
+def _error_response(
+        template: Dict[str, Any],
+        details: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None
+) -> ORJSONResponse:
+    body = template.copy()
+    body["details"] = details
+    return ORJSONResponse(status_code=body["code"], content=body, headers=headers)
 
 
-async def validation_exception_handler(request: Request, exc: ValidationException) -> JSONResponse:
-    """Handle validation exceptions."""
-    logger.warning(f"Validation error: {exc}")
-    error_response = ErrorResponse(
-        code=422,
-        message="Validation error",
-        details={"error": str(exc)}
-    )
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=error_response.model_dump()
-    )
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Handle general exceptions."""
+    logger.error("Unhandled exception: %s", exc, exc_info=LOG_STACK_TRACES)
+    error = str(exc)[:MAX_ERROR_DETAIL_LENGTH]
+    return _error_response(_INTERNAL_ERROR, {"error": error} if error else None)
 
 
-async def conflict_exception_handler(request: Request, exc: ConflictException) -> JSONResponse:
-    """Handle conflict exceptions."""
-    logger.warning(f"Conflict: {exc}")
-    error_response = ErrorResponse(
-        code=409,
-        message="Conflict",
-        details={"error": str(exc)}
-    )
-    return JSONResponse(
-        status_code=status.HTTP_409_CONFLICT,
-        content=error_response.model_dump()
-    )
+# Application exception -> (error body template, log level, log prefix)
+_APP_EXCEPTIONS = {
+    UnauthorizedException: (_UNAUTHORIZED, logging.WARNING, "Unauthorized access"),
+    NotFoundException: (_NOT_FOUND, logging.WARNING, "Resource not found"),
+    BadRequestException: (_BAD_REQUEST, logging.WARNING, "Bad request"),
+    ValidationException: (_VALIDATION_ERROR, logging.WARNING, "Validation error"),
+    ConflictException: (_CONFLICT, logging.WARNING, "Conflict"),
+    ServiceUnavailableException: (_SERVICE_UNAVAILABLE, logging.WARNING, "Service unavailable"),
+    InternalServerErrorException: (_INTERNAL_ERROR, logging.ERROR, "Internal server error"),
+}
 
 
-async def internal_server_error_exception_handler(
-    request: Request,
-    exc: InternalServerErrorException
-) -> JSONResponse:
-    """Handle internal server error exceptions."""
-    logger.error(f"Internal server error: {exc}", exc_info=True)
-    error_response = ErrorResponse(
-        code=500,
-        message="Internal server error",
-        details={"error": str(exc)}
-    )
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump()
+async def app_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Handle the exceptions defined in utils.exceptions."""
+    # Walk the MRO so subclasses of a registered exception map to their parent's entry
+    template, level, prefix = next(
+        _APP_EXCEPTIONS[cls] for cls in type(exc).__mro__ if cls in _APP_EXCEPTIONS
     )
+    logger.log(level, "%s: %s", prefix, exc, exc_info=LOG_STACK_TRACES and level >= logging.ERROR)
+    retry_after = getattr(exc, "retry_after", None)
+    headers = {"Retry-After": str(max(1, math.ceil(retry_after)))} if retry_after is not None else None
+    return _error_response(template, {"error": str(exc)}, headers)
 
 
-async def validation_error_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_error_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
-    logger.warning(f"Validation error: {exc}")
     errors = []
     for error in exc.errors():
         errors.append({
@@ -132,25 +94,15 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
             "message": error["msg"],
             "type": error["type"]
         })
-    
-    error_response = ErrorResponse(
-        code=422,
-        message="Request validation failed",
-        details={"errors": errors}
-    )
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=error_response.model_dump()
-    )
+
+    # Logged by path: str(exc) names the endpoint's source, which is wrong for wrapped routes
+    logger.warning("Validation error on %s %s: %s", request.method, request.url.path, errors)
+    return _error_response(_REQUEST_VALIDATION_FAILED, {"errors": errors})
 
 
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers to the FastAPI app."""
-    app.add_exception_handler(UnauthorizedException, unauthorized_exception_handler)
-    app.add_exception_handler(NotFoundException, not_found_exception_handler)
-    app.add_exception_handler(BadRequestException, bad_request_exception_handler)
-    app.add_exception_handler(ValidationException, validation_exception_handler)
-    app.add_exception_handler(ConflictException, conflict_exception_handler)
-    app.add_exception_handler(InternalServerErrorException, internal_server_error_exception_handler)
+    for exc_class in _APP_EXCEPTIONS:
+        app.add_exception_handler(exc_class, app_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_error_handler)
     app.add_exception_handler(Exception, general_exception_handler)
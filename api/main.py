@@ -1,26 +1,61 @@
+import asyncio
+import contextlib
 import logging
+import os
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
+
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.openapi.utils import get_openapi
 
 from api.routers import auth as auth_routes
 from api.routers import cases as cases_routes
 from api.routers import cause_list as cause_list_routes
+from api.routers import session as session_routes
 from api.exceptions import register_exception_handlers
+from api.dependencies import add_security_schemes
+from api.responses import ORJSONResponse
+from api.middleware import OriginCORSMiddleware
 from api.schemas import HealthCheckResponse
+from scraper.auth_manager import token_cache
+from scraper.http import create_client
 
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
 
+async def warm_up(client) -> None:
+    """Prime the states cache so the first caller after a deploy is served from memory."""
+    started = time.perf_counter()
+    try:
+        token = await token_cache.get(client)
+        if token is not None:
+            await cause_list_routes.warm_cache(client, token)
+    except Exception as e:
+        logger.warning("Warm-up failed: %s", e)
+        return
+    logger.info("Warm-up finished in %.2fs", time.perf_counter() - started)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("E-Courts API starting up")
+    app.state.http_client = create_client()
+    # Warm the token in the background so neither startup nor the first caller waits on it
+    app.state.token_task = asyncio.create_task(token_cache.keep_fresh(app.state.http_client))
+    app.state.warmup_task = asyncio.create_task(warm_up(app.state.http_client))
+    app.state.openapi_body = orjson.dumps(app.openapi())
     yield
+    for task in (app.state.warmup_task, app.state.token_task):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await app.state.http_client.aclose()
     logger.info("E-Courts API shutting down")
 
 
@@ -28,46 +63,75 @@ app = FastAPI(
     title="E-Courts API",
     description="REST API for Indian e-Courts data. Get token from /auth/token, then use 🔓 Authorize button.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 app.add_middleware(
-    CORSMiddleware,
+    OriginCORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
-
-app.add_middleware(
-    TrustedHostMiddleware,
-    allowed_hosts=["*"]  # Allow all hosts
-)
+# Court listings are repetitive JSON; small bodies are not worth compressing
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 register_exception_handlers(app)
 
 app.include_router(auth_routes.router)
 app.include_router(cases_routes.router)
 app.include_router(cause_list_routes.router)
+app.include_router(session_routes.router)
+
+
+def custom_openapi() -> dict:
+    if app.openapi_schema is None:
+        app.openapi_schema = add_security_schemes(get_openapi(
+            title=app.title,
+            version=app.version,
+            description=app.description,
+            routes=app.routes,
+        ))
+    return app.openapi_schema
 
 
-@app.get("/health", response_model=HealthCheckResponse, tags=["Health"])
-async def health_check() -> dict:
-    return {"status": "healthy", "message": "API is running"}
+app.openapi = custom_openapi
+
+# FastAPI's built-in schema route re-serializes the whole document on every hit;
+# swap it for one that serves the bytes rendered once at startup.
+app.router.routes = [route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url]
+
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_schema() -> Response:
+    return Response(app.state.openapi_body, media_type="application/json")
+
+
+# Both bodies are static, so they are serialized once instead of on every probe
+_HEALTH_BODY = orjson.dumps(HealthCheckResponse().model_dump())
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to E-Courts API",
+    "version": "1.0.0",
+    "docs": "/docs"
+})
+
+
+@app.get("/health", responses={200: {"model": HealthCheckResponse}}, tags=["Health"])
+async def health_check() -> Response:
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/", tags=["Root"])
-async def root() -> dict:
-    return {
-        "message": "Welcome to E-Courts API",
-        "version": "1.0.0",
-        "docs": "/docs"
-    }
+async def root() -> Response:
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    
+
+    # Development entry point; loop/http stay on "auto", which already picks uvloop and
+    # httptools when uvicorn[standard] is installed. See `just prod` for production flags.
     uvicorn.run(
         "api.main:app",
         host="0.0.0.0",
@@ -0,0 +1,20 @@
+"""
+ASGI middleware used by the API.
+"""
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class OriginCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that skips all CORS handling for requests without an Origin header.
+
+    Server-to-server callers never send Origin, so checking the raw ASGI headers first
+    avoids building a Headers object and running the CORS logic for them.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not any(key == b"origin" for key, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
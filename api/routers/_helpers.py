@@ -0,0 +1,66 @@
+import functools
+import logging
+from typing import Any, Awaitable, Callable
+
+import orjson
+from fastapi import Response
+
+from utils.exceptions import (
+    UnauthorizedException,
+    BadRequestException,
+    NotFoundException,
+    ServiceUnavailableException
+)
+
+# Mapped to their own error responses by api.exceptions, so they pass through unlogged
+_EXPECTED_ERRORS = (
+    UnauthorizedException,
+    BadRequestException,
+    NotFoundException,
+    ServiceUnavailableException,
+)
+
+
+def success_prefix(message: str) -> bytes:
+    """Serialized success envelope up to the opening of its `data` value."""
+    return orjson.dumps({"status": "success", "code": 200, "message": message})[:-1] + b',"data":'
+
+
+def success_body(prefix: bytes, data: Any) -> bytes:
+    return prefix + orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b"}"
+
+
+def scraper_route(message: str | None = None):
+    """
+    Shared error handling for routes that call the scraper.
+
+    Unexpected errors are logged under the route's name and re-raised. When a message
+    is given, plain results are written into the success envelope, whose constant part
+    is serialized once here; Response objects are returned as they are.
+
+    FastAPI takes an endpoint's file from its code object, so it attributes wrapped routes
+    to this module while taking the line from the route itself. Log validation errors by
+    request path rather than through FastAPI's endpoint location.
+    """
+    prefix = success_prefix(message) if message is not None else None
+
+    def decorate(fn: Callable[..., Awaitable[Any]]):
+        logger = logging.getLogger(fn.__module__)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                result = await fn(*args, **kwargs)
+            except _EXPECTED_ERRORS:
+                raise
+            except Exception as e:
+                logger.error("Error in %s: %s", fn.__name__, e)
+                raise
+
+            if prefix is None or isinstance(result, Response):
+                return result
+            return Response(success_body(prefix, result), media_type="application/json")
+
+        return wrapper
+
+    return decorate
@@ -2,9 +2,10 @@ import logging
 import httpx
 from fastapi import APIRouter, Depends
 
-from scraper.auth_manager import get_jwt_token
+from scraper.auth_manager import token_cache
 from api.schemas import AuthTokenResponse, ErrorResponse
 from api.dependencies import get_http_client
+from api.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -12,33 +13,33 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 @router.post(
     "/token",
-    response_model=AuthTokenResponse,
-    responses={500: {"model": ErrorResponse}},
+    responses={200: {"model": AuthTokenResponse}, 500: {"model": ErrorResponse}},
     summary="Generate JWT Token"
 )
-async def get_token(client: httpx.Client = Depends(get_http_client)) -> dict:
+async def get_token(client: httpx.AsyncClient = Depends(get_http_client)) -> ORJSONResponse:
+    # The handler owns the response shape, so it skips response_model validation
     try:
-        token = get_jwt_token(client)
-        
+        token = await token_cache.get(client)
+
         if token is None:
-            return {
+            return ORJSONResponse({
                 "status": "error",
                 "code": 500,
-                "message": "Failed to generate token"
-            }
-        
-        return {
+                "message": "Failed to generate token",
+                "data": None
+            })
+
+        return ORJSONResponse({
             "status": "success",
             "code": 200,
             "message": "Token generated. Use in Authorization header",
             "data": {"token": token}
-        }
+        })
     except Exception as e:
-        logger.error(f"Token generation error: {e}")
-        return {
+        logger.error("Token generation error: %s", e)
+        return ORJSONResponse({
             "status": "error",
             "code": 500,
-            "message": f"Failed to generate token: {str(e)}"
-        }
-    finally:
-        client.close()
+            "message": f"Failed to generate token: {str(e)}",
+            "data": None
+        })
@@ -1,13 +1,17 @@
-import logging
+import asyncio
+
 import httpx
 from fastapi import APIRouter, Depends, status
 
 from scraper.case_manager import get_details_by_cnr
-from api.schemas import CaseDetailResponse, ErrorResponse
-from api.dependencies import get_http_client, get_auth_token
-from utils.exceptions import UnauthorizedException, BadRequestException, NotFoundException
+from api.schemas import CaseDetailResponse, CaseBatchRequest, CaseBatchResponse, ErrorResponse
+from api.dependencies import get_client_and_token, BEARER_AUTH_OPENAPI
+from api.routers._helpers import scraper_route
+from utils.exceptions import UnauthorizedException, ServiceUnavailableException
+
+# These affect every CNR in the batch, so they fail the whole request
+_BATCH_FATAL_ERRORS = (UnauthorizedException, ServiceUnavailableException)
 
-logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/cases", tags=["Cases"])
 
 
@@ -21,25 +25,50 @@ router = APIRouter(prefix="/cases", tags=["Cases"])
         404: {"model": ErrorResponse},
         500: {"model": ErrorResponse},
     },
-    summary="Get Case Details by CNR"
+    summary="Get Case Details by CNR",
+    openapi_extra=BEARER_AUTH_OPENAPI
 )
+@scraper_route("Case details retrieved")
 async def get_case_details(
     cnr: str,
-    token: str = Depends(get_auth_token),
-    client: httpx.Client = Depends(get_http_client)
+    upstream: tuple[httpx.AsyncClient, str] = Depends(get_client_and_token)
+) -> dict:
+    client, token = upstream
+    return await get_details_by_cnr(client, token, cnr)
+
+
+@router.post(
+    "/details/batch",
+    response_model=CaseBatchResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        401: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
+    },
+    summary="Get Case Details for Several CNRs",
+    openapi_extra=BEARER_AUTH_OPENAPI
+)
+@scraper_route("Case details retrieved")
+async def get_case_details_batch(
+    request: CaseBatchRequest,
+    upstream: tuple[httpx.AsyncClient, str] = Depends(get_client_and_token)
 ) -> dict:
-    try:
-        details = get_details_by_cnr(client, token, cnr)
-        return {
-            "status": "success",
-            "code": 200,
-            "message": "Case details retrieved",
-            "data": details
-        }
-    except (UnauthorizedException, NotFoundException, BadRequestException):
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching case {cnr}: {e}")
-        raise
-    finally:
-        client.close()
+    client, token = upstream
+    cnrs = list(dict.fromkeys(request.cnrs))
+    # Lookups run concurrently; one CNR failing only marks its own entry
+    results = await asyncio.gather(
+        *(get_details_by_cnr(client, token, cnr) for cnr in cnrs),
+        return_exceptions=True
+    )
+
+    details = {}
+    for cnr, result in zip(cnrs, results):
+        if isinstance(result, BaseException):
+            # Request-wide failures and non-Exception errors such as cancellation are not entries
+            if isinstance(result, _BATCH_FATAL_ERRORS) or not isinstance(result, Exception):
+                raise result
+            result = {"error": str(result)}
+        details[cnr] = result
+    return details
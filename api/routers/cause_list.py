@@ -1,6 +1,7 @@
-import logging
+from typing import Awaitable, Callable, Hashable
+
 import httpx
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from scraper.cause_list_manager import (
     get_states, get_districts, get_court_complex, get_court_name, get_cause_list
@@ -11,13 +12,72 @@ from api.schemas import (
     CourtNameRequest, CourtNameResponse,
     CauseListRequest, CauseListResponse, ErrorResponse
 )
-from api.dependencies import get_http_client, get_auth_token
+from api.dependencies import get_client_and_token, BEARER_AUTH_OPENAPI
+from api.routers._helpers import scraper_route, success_body, success_prefix
+from utils.cache import SingleFlight, TTLCache
 from utils.cause_list_type import CauseListType
-from utils.exceptions import UnauthorizedException, BadRequestException, NotFoundException
 
-logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/court", tags=["Court & Cause List"])
 
+# Reference data changes rarely, so successful lookups are kept as ready-to-send JSON bytes.
+# States and districts change on the order of days; court listings are refreshed more often.
+_STATES_CACHE = TTLCache(maxsize=1, ttl=86400)
+_DISTRICTS_CACHE = TTLCache(maxsize=50, ttl=86400)
+_COURT_LOOKUP_CACHE = TTLCache(maxsize=10_000, ttl=1800)
+# CauseListRequest only admits these two values, so the lookup cannot miss
+_CAUSE_LIST_TYPES = {"CIVIL": CauseListType.CIVIL, "CRIMINAL": CauseListType.CRIMINAL}
+# Concurrent misses for the same lookup share one upstream call
+_lookups_in_flight = SingleFlight()
+
+_STATES_PREFIX = success_prefix("States retrieved")
+_DISTRICTS_PREFIX = success_prefix("Districts retrieved")
+_COURT_COMPLEX_PREFIX = success_prefix("Court complex retrieved")
+_COURT_NAMES_PREFIX = success_prefix("Court names retrieved")
+
+
+async def _cached_lookup(
+    cache: TTLCache,
+    key: Hashable,
+    prefix: bytes,
+    fetch: Callable[[], Awaitable[dict]]
+) -> Response:
+    return Response(await _cached_body(cache, key, prefix, fetch), media_type="application/json")
+
+
+async def _cached_body(
+    cache: TTLCache,
+    key: Hashable,
+    prefix: bytes,
+    fetch: Callable[[], Awaitable[dict]]
+) -> bytes:
+    body = cache.get(key)
+    if body is None:
+        body = await _lookups_in_flight.do((prefix, key), lambda: _fetch_and_cache(cache, key, prefix, fetch))
+    return body
+
+
+async def _fetch_and_cache(
+    cache: TTLCache,
+    key: Hashable,
+    prefix: bytes,
+    fetch: Callable[[], Awaitable[dict]]
+) -> bytes:
+    body = success_body(prefix, await fetch())
+    cache.set(key, body)
+    return body
+
+
+async def warm_cache(client: httpx.AsyncClient, token: str) -> None:
+    """Fetch the states list into the cache ahead of the first request."""
+    await states_json(client, token)
+
+
+async def states_json(client: httpx.AsyncClient, token: str) -> bytes:
+    """The serialized states payload, shared with the /court/states cache."""
+    body = await _cached_body(_STATES_CACHE, (), _STATES_PREFIX, lambda: get_states(client, token))
+    # Cached bodies are the envelope prefix, the payload and the closing brace
+    return body[len(_STATES_PREFIX):-1]
+
 
 @router.get(
     "/states",
@@ -28,27 +88,18 @@ router = APIRouter(prefix="/court", tags=["Court & Cause List"])
         404: {"model": ErrorResponse},
         500: {"model": ErrorResponse},
     },
-    summary="Get States"
+    summary="Get States",
+    openapi_extra=BEARER_AUTH_OPENAPI
 )
+@scraper_route()
 async def fetch_states(
-    token: str = Depends(get_auth_token),
-    client: httpx.Client = Depends(get_http_client)
-) -> dict:
-    try:
-        states = get_states(client, token)
-        return {
-            "status": "success",
-            "code": 200,
-            "message": "States retrieved",
-            "data": states
-        }
-    except (UnauthorizedException, NotFoundException):
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching states: {e}")
-        raise
-    finally:
-        client.close()
+    upstream: tuple[httpx.AsyncClient, str] = Depends(get_client_and_token)
+) -> Response:
+    client, token = upstream
+    return await _cached_lookup(
+        _STATES_CACHE, (), _STATES_PREFIX,
+        lambda: get_states(client, token)
+    )
 
 
 @router.post(
@@ -56,28 +107,19 @@ async def fetch_states(
     response_model=DistrictsResponse,
     status_code=status.HTTP_200_OK,
     responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
-    summary="Get Districts by State"
+    summary="Get Districts by State",
+    openapi_extra=BEARER_AUTH_OPENAPI
 )
+@scraper_route()
 async def fetch_districts(
     request: DistrictsRequest,
-    token: str = Depends(get_auth_token),
-    client: httpx.Client = Depends(get_http_client)
-) -> dict:
-    try:
-        districts = get_districts(client, token, request.state_code)
-        return {
-            "status": "success",
-            "code": 200,
-            "message": "Districts retrieved",
-            "data": districts
-        }
-    except (UnauthorizedException, BadRequestException, NotFoundException):
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching districts: {e}")
-        raise
-    finally:
-        client.close()
+    upstream: tuple[httpx.AsyncClient, str] = Depends(get_client_and_token)
+) -> Response:
+    client, token = upstream
+    return await _cached_lookup(
+        _DISTRICTS_CACHE, request.state_code, _DISTRICTS_PREFIX,
+        lambda: get_districts(client, token, request.state_code)
+    )
 
 
 @router.post(
@@ -85,28 +127,19 @@ async def fetch_districts(
     response_model=CourtComplexResponse,
     status_code=status.HTTP_200_OK,
     responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
-    summary="Get Court Complex"
+    summary="Get Court Complex",
+    openapi_extra=BEARER_AUTH_OPENAPI
 )
+@scraper_route()
 async def fetch_court_complex(
     request: CourtComplexRequest,
-    token: str = Depends(get_auth_token),
-    client: httpx.Client = Depends(get_http_client)
-) -> dict:
-    try:
-        complex_data = get_court_complex(client, token, request.state_code, request.district_code)
-        return {
-            "status": "success",
-            "code": 200,
-            "message": "Court complex retrieved",
-            "data": complex_data
-        }
-    except (UnauthorizedException, BadRequestException, NotFoundException):
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching court complex: {e}")
-        raise
-    finally:
-        client.close()
+    upstream: tuple[httpx.AsyncClient, str] = Depends(get_client_and_token)
+) -> Response:
+    client, token = upstream
+    return await _cached_lookup(
+        _COURT_LOOKUP_CACHE, ("complex", request.state_code, request.district_code), _COURT_COMPLEX_PREFIX,
+        lambda: get_court_complex(client, token, request.state_code, request.district_code)
+    )
 
 
 @router.post(
@@ -114,28 +147,19 @@ async def fetch_court_complex(
     response_model=CourtNameResponse,
     status_code=status.HTTP_200_OK,
     responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
-    summary="Get Court Names"
+    summary="Get Court Names",
+    openapi_extra=BEARER_AUTH_OPENAPI
 )
+@scraper_route()
 async def fetch_court_names(
     request: CourtNameRequest,
-    token: str = Depends(get_auth_token),
-    client: httpx.Client = Depends(get_http_client)
-) -> dict:
-    try:
-        names = get_court_name(client, token, request.state_code, request.district_code, request.court_code)
-        return {
-            "status": "success",
-            "code": 200,
-            "message": "Court names retrieved",
-            "data": names
-        }
-    except (UnauthorizedException, BadRequestException, NotFoundException):
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching court names: {e}")
-        raise
-    finally:
-        client.close()
+    upstream: tuple[httpx.AsyncClient, str] = Depends(get_client_and_token)
+) -> Response:
+    client, token = upstream
+    return await _cached_lookup(
+        _COURT_LOOKUP_CACHE, ("names", request.state_code, request.district_code, request.court_code), _COURT_NAMES_PREFIX,
+        lambda: get_court_name(client, token, request.state_code, request.district_code, request.court_code)
+    )
 
 
 @router.post(
@@ -143,31 +167,17 @@ async def fetch_court_names(
     response_model=CauseListResponse,
     status_code=status.HTTP_200_OK,
     responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
-    summary="Get Cause List"
+    summary="Get Cause List",
+    openapi_extra=BEARER_AUTH_OPENAPI
 )
+@scraper_route("Cause list retrieved")
 async def fetch_cause_list(
     request: CauseListRequest,
-    token: str = Depends(get_auth_token),
-    client: httpx.Client = Depends(get_http_client)
+    upstream: tuple[httpx.AsyncClient, str] = Depends(get_client_and_token)
 ) -> dict:
-    try:
-        cause_type = CauseListType[request.cause_list_type.upper()]
-        cause_list = get_cause_list(
-            client, token, request.state_code, request.district_code,
-            request.court_code, request.court_number, cause_type, request.date
-        )
-        return {
-            "status": "success",
-            "code": 200,
-            "message": "Cause list retrieved",
-            "data": cause_list
-        }
-    except KeyError:
-        raise BadRequestException("Invalid cause list type. Must be 'CIVIL' or 'CRIMINAL'")
-    except (UnauthorizedException, BadRequestException, NotFoundException):
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching cause list: {e}")
-        raise
-    finally:
-        client.close()
+    client, token = upstream
+    return await get_cause_list(
+        client, token, request.state_code, request.district_code,
+        request.court_code, request.court_number,
+        _CAUSE_LIST_TYPES[request.cause_list_type], request.date
+    )
@@ -0,0 +1,33 @@
+import httpx
+import orjson
+from fastapi import APIRouter, Depends, Response, status
+
+from scraper.auth_manager import token_cache
+from api.schemas import SessionBootstrapResponse, ErrorResponse
+from api.dependencies import get_http_client
+from api.routers._helpers import scraper_route, success_prefix
+from api.routers.cause_list import states_json
+from utils.exceptions import InternalServerErrorException
+
+router = APIRouter(prefix="/session", tags=["Session"])
+
+_BOOTSTRAP_PREFIX = success_prefix("Session ready")
+
+
+@router.post(
+    "/bootstrap",
+    response_model=SessionBootstrapResponse,
+    status_code=status.HTTP_200_OK,
+    responses={401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    summary="Get a Token and the States List"
+)
+@scraper_route()
+async def bootstrap_session(client: httpx.AsyncClient = Depends(get_http_client)) -> Response:
+    # Saves new clients the /auth/token -> /court/states round trip
+    token = await token_cache.get(client)
+    if token is None:
+        raise InternalServerErrorException("Failed to generate token")
+
+    states = await states_json(client, token)
+    body = _BOOTSTRAP_PREFIX + b'{"token":' + orjson.dumps(token) + b',"states":' + states + b"}}"
+    return Response(body, media_type="application/json")
@@ -2,8 +2,8 @@
 Pydantic schemas for request and response validation.
 """
 
-from typing import Optional, Any, Dict, List
-from pydantic import BaseModel, Field, validator
+from typing import Optional, Any, Dict, List, Literal
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ErrorResponse(BaseModel):
@@ -29,18 +29,22 @@ class AuthTokenResponse(SuccessResponse):
     data: Dict[str, str] = Field(default=None)
 
 
+class SessionBootstrapResponse(SuccessResponse):
+    """Response with a token and the states list for a new client session."""
+    data: Optional[Dict[str, Any]] = None
+
+
 # ===== Case Schemas =====
 
 class CaseDetailRequest(BaseModel):
     """Request model for getting case details by CNR."""
     cnr: str = Field(..., min_length=1, max_length=100, description="Case Number Reference")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "cnr": "UPBL060021142023"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "cnr": "UPBL060021142023"
         }
+    })
 
 
 class CaseDetailResponse(SuccessResponse):
@@ -48,6 +52,22 @@ class CaseDetailResponse(SuccessResponse):
     data: Optional[Dict[str, Any]] = None
 
 
+class CaseBatchRequest(BaseModel):
+    """Request model for getting case details for several CNRs at once."""
+    cnrs: List[str] = Field(..., min_length=1, max_length=25, description="Case Number References")
+
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "cnrs": ["UPBL060021142023", "DLHC010123452024"]
+        }
+    })
+
+
+class CaseBatchResponse(SuccessResponse):
+    """Response for batched case details, keyed by CNR."""
+    data: Optional[Dict[str, Any]] = None
+
+
 # ===== Cause List Related Schemas =====
 
 class StatesResponse(SuccessResponse):
@@ -59,12 +79,11 @@ class DistrictsRequest(BaseModel):
     """Request model for getting districts by state."""
     state_code: str = Field(..., min_length=1, description="State code")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "state_code": "5"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "state_code": "5"
         }
+    })
 
 
 class DistrictsResponse(SuccessResponse):
@@ -77,13 +96,12 @@ class CourtComplexRequest(BaseModel):
     state_code: str = Field(..., min_length=1, description="State code")
     district_code: str = Field(..., min_length=1, description="District code")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "state_code": "5",
-                "district_code": "7"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "state_code": "5",
+            "district_code": "7"
         }
+    })
 
 
 class CourtComplexResponse(SuccessResponse):
@@ -97,14 +115,13 @@ class CourtNameRequest(BaseModel):
     district_code: str = Field(..., min_length=1, description="District code")
     court_code: str = Field(..., min_length=1, description="Court code")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "state_code": "5",
-                "district_code": "7",
-                "court_code": "3"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "state_code": "5",
+            "district_code": "7",
+            "court_code": "3"
         }
+    })
 
 
 class CourtNameResponse(SuccessResponse):
@@ -118,10 +135,9 @@ class CauseListRequest(BaseModel):
     district_code: str = Field(..., min_length=1, description="District code")
     court_code: str = Field(..., min_length=1, description="Court code")
     court_number: str = Field(..., min_length=1, description="Court number")
-    cause_list_type: str = Field(
+    cause_list_type: Literal["CIVIL", "CRIMINAL"] = Field(
         ...,
-        description="Type of cause list: 'CIVIL' or 'CRIMINAL'",
-        pattern="^(CIVIL|CRIMINAL)$"
+        description="Type of cause list: 'CIVIL' or 'CRIMINAL'"
     )
     date: str = Field(
         ...,
@@ -129,17 +145,16 @@ class CauseListRequest(BaseModel):
         pattern=r"^\d{2}-\d{2}-\d{4}$"
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "state_code": "5",
-                "district_code": "7",
-                "court_code": "1",
-                "court_number": "1",
-                "cause_list_type": "CIVIL",
-                "date": "16-10-2020"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "state_code": "5",
+            "district_code": "7",
+            "court_code": "1",
+            "court_number": "1",
+            "cause_list_type": "CIVIL",
+            "date": "16-10-2020"
         }
+    })
 
 
 class CauseListResponse(SuccessResponse):
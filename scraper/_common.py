@@ -0,0 +1,159 @@
+import asyncio
+import functools
+import random
+import time
+
+from httpx import AsyncClient, Response, TransportError
+
+from utils.crypto_utils import encrypt_request, decrypt_response
+from utils.exceptions import (
+    UnauthorizedException,
+    BadRequestException,
+    NotFoundException,
+    ServiceUnavailableException
+)
+
+# Throttling and transient upstream failures are worth another attempt
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.1
+# A longer Retry-After than this is not waited out; the caller gets the error instead
+RETRY_MAX_DELAY = 2.0
+# After this many failed calls in a row, fail fast until the reset timeout has passed
+BREAKER_FAIL_MAX = 10
+BREAKER_RESET_TIMEOUT = 30.0
+
+# Sent with every body that accepts them so the upstream answers in English only
+ENGLISH_ONLY = {'language_flag': 'english', 'bilingual_flag': '0'}
+
+
+class _CircuitBreaker:
+    """Stops sending requests for a while once the upstream keeps failing."""
+
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def check(self) -> None:
+        if self._failures < self.fail_max:
+            return
+        remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+        if remaining > 0:
+            raise ServiceUnavailableException("e-Courts service is unavailable, try again shortly", remaining)
+
+    def record(self, ok: bool) -> None:
+        if ok:
+            self._failures = 0
+            return
+        self._failures += 1
+        if self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+
+
+_breaker = _CircuitBreaker(BREAKER_FAIL_MAX, BREAKER_RESET_TIMEOUT)
+
+
+def _backoff(attempt: int) -> float:
+    # Full jitter keeps concurrent retries from arriving together
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+
+def _retry_after(response: Response) -> float | None:
+    """Seconds from a numeric Retry-After header; HTTP dates are not honoured."""
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+def _retry_delay(response: Response, attempt: int) -> float | None:
+    if "Retry-After" not in response.headers:
+        return _backoff(attempt)
+    delay = _retry_after(response)
+    return delay if delay is not None and delay <= RETRY_MAX_DELAY else None
+
+
+def _is_json(body: bytes) -> bool:
+    """Upstream errors come back as plain JSON; real payloads are hex IV + base64 ciphertext."""
+    return body.lstrip()[:1] in (b'{', b'[')
+
+
+@functools.lru_cache(maxsize=256)
+def _auth_header(token: str) -> str:
+    # The upstream decrypts whatever IV the header carries, so one ciphertext per token is enough
+    return f"Bearer {encrypt_request(token)}"
+
+
+async def _encrypted_request(client: AsyncClient, path: str, body: dict, token: str | None = None) -> Response:
+    """GET an upstream endpoint with `body` encrypted into the `params` query argument."""
+    # httpx percent-encodes the query itself, so the ciphertext is not quoted here first
+    headers = {'Authorization': _auth_header(token)} if token is not None else None
+    return await client.get(path, params={'params': encrypt_request(body)}, headers=headers)
+
+
+async def _send_with_retry(client: AsyncClient, path: str, body: dict, token: str) -> Response:
+    """
+    Send an upstream request, retrying transient failures.
+
+    Raises ServiceUnavailableException when the upstream stays unreachable or keeps
+    answering with a retryable status, so an outage always reaches clients as a 503.
+    """
+    _breaker.check()
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            response = await _encrypted_request(client, path, body, token)
+        except TransportError as e:
+            # Refused connections and timeouts are outages too, so they count against the breaker
+            if attempt == MAX_ATTEMPTS - 1:
+                _breaker.record(False)
+                raise ServiceUnavailableException(f"e-Courts service is unreachable: {e}") from e
+            await asyncio.sleep(_backoff(attempt))
+            continue
+
+        if response.status_code not in RETRY_STATUSES:
+            _breaker.record(True)
+            return response
+
+        delay = _retry_delay(response, attempt)
+        if delay is None or attempt == MAX_ATTEMPTS - 1:
+            break
+        await asyncio.sleep(delay)
+
+    _breaker.record(False)
+    raise ServiceUnavailableException(
+        f"e-Courts service answered {response.status_code}, try again shortly",
+        _retry_after(response)
+    )
+
+
+async def _call(
+        client: AsyncClient,
+        token: str,
+        path: str,
+        body: dict,
+        not_found: str,
+        error_prefix: str
+) -> dict:
+    """
+    Make one authorised upstream call and return its decrypted payload.
+
+    Transient failures are retried with backoff. Raises ServiceUnavailableException when the
+    upstream is down, UnauthorizedException for rejected tokens, BadRequestException for other
+    non-200 statuses and NotFoundException when the upstream answers with plain JSON.
+    """
+    response = await _send_with_retry(client, path, body, token)
+
+    if response.status_code in (401, 403):
+        raise UnauthorizedException(f"Request unauthorised: {response.text}")
+    elif response.status_code != 200:
+        raise BadRequestException(f"{error_prefix}: {response.status_code}: {response.text}")
+
+    if _is_json(response.content):
+        raise NotFoundException(not_found)
+
+    data = decrypt_response(response.content)
+    if isinstance(data, dict) and data.get('status') == 'N' and 'UnAuthorized' in str(data.get('Msg', '')):
+        raise UnauthorizedException("Token expired or invalid. Generate a new token from /auth/token")
+    return data
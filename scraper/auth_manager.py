@@ -1,30 +1,110 @@
+import asyncio
+import base64
+import json
 import logging
-import urllib.parse
-from httpx import Client
+import time
+from httpx import AsyncClient
 
-from utils.constants import DEVICE_ID, BASE_URL
+from utils.constants import APP_UID
 from utils.crypto_utils import encrypt_request, decrypt_response
 
 logger = logging.getLogger(__name__)
 
+# Seconds shaved off the token's own expiry so we never hand out one that is about to lapse
+TOKEN_EXPIRY_MARGIN = 30
+# Used when the token carries no readable `exp` claim (upstream tokens last ~10 minutes)
+TOKEN_FALLBACK_TTL = 540
+# Share of a token's life it is reused for, so clients are always handed at least the rest
+TOKEN_REUSE_FRACTION = 0.5
+# The background refresher renews the token this long before the cached copy lapses
+TOKEN_REFRESH_LEAD_TIME = 60
+# Minimum pause between refresh attempts, also used after a failed fetch
+TOKEN_RETRY_DELAY = 10
 
-def get_jwt_token(client: Client) -> str | None:
-    try:
-        body = {"version": "3.0", "uid": f"{DEVICE_ID}:in.gov.ecourts.eCourtsServices"}
-        enc_body = encrypt_request(body)
-        encoded_body = urllib.parse.quote(enc_body)
 
-        response = client.get(
-            f"{BASE_URL}/appReleaseWebService.php?params={encoded_body}",
+async def get_jwt_token(client: AsyncClient) -> str | None:
+    try:
+        body = {"version": "3.0", "uid": APP_UID}
+        response = await client.get(
+            "/appReleaseWebService.php",
+            params={"params": encrypt_request(body)},
             timeout=30
         )
 
+        logger.debug("Token request served over %s", response.http_version)
         if response.status_code != 200:
             return None
 
-        dec_response = decrypt_response(response.text)
+        dec_response = decrypt_response(response.content)
         return dec_response.get("token")
 
     except Exception as e:
-        logger.error(f"Auth failed: {e}")
-        return None
\ No newline at end of file
+        logger.error("Auth failed: %s", e)
+        return None
+
+
+def get_token_exp(token: str) -> float | None:
+    """The token's unverified `exp` claim as a Unix timestamp, or None when it has no readable one."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def get_token_ttl(token: str) -> float:
+    """Seconds the token can still be handed out, based on its unverified `exp` claim."""
+    exp = get_token_exp(token)
+    if exp is None:
+        return TOKEN_FALLBACK_TTL
+    return exp - time.time() - TOKEN_EXPIRY_MARGIN
+
+
+class TokenCache:
+    """Keeps the last upstream token for the first half of its lifetime."""
+
+    def __init__(self):
+        self._token: str | None = None
+        self._reuse_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def peek(self) -> str | None:
+        if self._token is not None and time.monotonic() < self._reuse_until:
+            return self._token
+        return None
+
+    async def get(self, client: AsyncClient) -> str | None:
+        token = self.peek()
+        if token is not None:
+            return token
+
+        # Only one coroutine goes upstream; the rest wait and reuse its token
+        async with self._lock:
+            token = self.peek()
+            if token is not None:
+                return token
+            return await self._fetch(client)
+
+    async def refresh(self, client: AsyncClient) -> str | None:
+        async with self._lock:
+            return await self._fetch(client)
+
+    async def keep_fresh(self, client: AsyncClient) -> None:
+        """Fetch a token now and renew it ahead of expiry until cancelled."""
+        while True:
+            delay = TOKEN_RETRY_DELAY
+            if await self.refresh(client) is not None:
+                remaining = self._reuse_until - time.monotonic()
+                delay = max(remaining - TOKEN_REFRESH_LEAD_TIME, TOKEN_RETRY_DELAY)
+            await asyncio.sleep(delay)
+
+    async def _fetch(self, client: AsyncClient) -> str | None:
+        token = await get_jwt_token(client)
+        if token is not None:
+            self._token = token
+            self._reuse_until = time.monotonic() + get_token_ttl(token) * TOKEN_REUSE_FRACTION
+        return token
+
+
+token_cache = TokenCache()
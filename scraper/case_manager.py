@@ -1,141 +1,68 @@
 import logging
-import urllib.parse
-from httpx import Client
+from httpx import AsyncClient
 
-from utils.constants import BASE_URL
-from utils.crypto_utils import encrypt_request, decrypt_response
-from utils.exceptions import UnauthorizedException, BadRequestException, NotFoundException
+from scraper._common import ENGLISH_ONLY, _call
+
+__all__ = ["get_details_by_cnr", "get_default_case_details", "get_filling_case_details", "get_case_list"]
 
 logger = logging.getLogger(__name__)
 
 
-def get_details_by_cnr(client: Client, token: str, cnr: str) -> dict:
-    try:
-        case_list = get_case_list(client, token, cnr)
-        if case_list.get("case_number") is None:
-            return get_filling_case_details(client, token, cnr)
-        else:
-            return get_default_case_details(client, token, cnr)
-    except UnauthorizedException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get case details: {e}")
-        raise
+async def get_details_by_cnr(client: AsyncClient, token: str, cnr: str) -> dict:
+    # Errors propagate as raised; the API layer logs and maps them
+    case_list = await get_case_list(client, token, cnr)
+    if case_list.get("case_number") is None:
+        return await get_filling_case_details(client, token, cnr)
+    return await get_default_case_details(client, token, cnr)
 
 
-def get_default_case_details(
-        client: Client,
+async def get_default_case_details(
+        client: AsyncClient,
         token: str,
         cnr: str
 ) -> dict:
     body = {
         'cinum': cnr,
-        'language_flag': 'english',
-        'bilingual_flag': '0'
+        **ENGLISH_ONLY
     }
-    enc_body = encrypt_request(body)
-    encoded_body = urllib.parse.quote(enc_body)
-
-    response = client.get(
-        f"{BASE_URL}/caseHistoryWebService.php?params={encoded_body}",
-        headers={
-            'Authorization': f'Bearer {encrypt_request(token)}'
-        }
+    data = await _call(
+        client, token, "/caseHistoryWebService.php", body,
+        "No case details found", "Error getting case detail by cnr"
     )
-
-    if response.status_code == 401 or response.status_code == 403:
-        raise UnauthorizedException(f"Request unauthorised: {response.text}")
-    elif response.status_code != 200:
-        raise BadRequestException(f"Error getting case detail by cnr: {response.status_code}: {response.text}")
-
-    try:
-        response.json()
-        raise NotFoundException("No case details found")
-    except (ValueError, KeyError) as e:
-        # If JSON parsing fails, assume it's encrypted data
-        pass
-
-    data = decrypt_response(response.text)
-    if isinstance(data, dict) and data.get('status') == 'N' and 'UnAuthorized' in str(data.get('Msg', '')):
-        raise UnauthorizedException("Token expired or invalid. Generate a new token from /auth/token")
-    logger.info(f"Default Case details retrieved by cnr: {data}")
+    logger.debug("Default case details retrieved by cnr %s: %s", cnr, data)
     return data
 
 
-def get_filling_case_details(
-        client: Client,
+async def get_filling_case_details(
+        client: AsyncClient,
         token: str,
         cnr: str
 ) -> dict:
     body = {
         'cino': cnr,
-        'language_flag': 'english',
-        'bilingual_flag': '0'
+        **ENGLISH_ONLY
     }
-    enc_body = encrypt_request(body)
-    encoded_body = urllib.parse.quote(enc_body)
-
-    response = client.get(
-        f"{BASE_URL}/filingCaseHistory.php?params={encoded_body}",
-        headers={
-            'Authorization': f'Bearer {encrypt_request(token)}'
-        }
+    data = await _call(
+        client, token, "/filingCaseHistory.php", body,
+        "No case details found", "Error getting filling case detail by cnr"
     )
-
-    if response.status_code == 401 or response.status_code == 403:
-        raise UnauthorizedException(f"Request unauthorised: {response.text}")
-    elif response.status_code != 200:
-        raise BadRequestException(f"Error getting filling case detail by cnr: {response.status_code}: {response.text}")
-
-    try:
-        response.json()
-        raise NotFoundException("No case details found")
-    except (ValueError, KeyError) as e:
-        # If JSON parsing fails, assume it's encrypted data
-        pass
-
-    data = decrypt_response(response.text)
-    if isinstance(data, dict) and data.get('status') == 'N' and 'UnAuthorized' in str(data.get('Msg', '')):
-        raise UnauthorizedException("Token expired or invalid. Generate a new token from /auth/token")
-    logger.info(f"Default Case details retrieved by cnr: {data}")
+    logger.debug("Filing case details retrieved by cnr %s: %s", cnr, data)
     return data
 
 
-def get_case_list(
-        client: Client,
+async def get_case_list(
+        client: AsyncClient,
         token: str,
         cnr: str
 ) -> dict:
     body = {
         'cino': cnr,
         'version_number': '3.0',
-        'language_flag': 'english',
-        'bilingual_flag': '0'
+        **ENGLISH_ONLY
     }
-    enc_body = encrypt_request(body)
-    encoded_body = urllib.parse.quote(enc_body)
-
-    response = client.get(
-        f"{BASE_URL}/listOfCasesWebService.php?params={encoded_body}",
-        headers={
-            'Authorization': f'Bearer {encrypt_request(token)}'
-        }
+    data = await _call(
+        client, token, "/listOfCasesWebService.php", body,
+        "No case list found", "Error getting case list by cnr"
     )
-
-    if response.status_code == 401 or response.status_code == 403:
-        raise UnauthorizedException(f"Request unauthorised: {response.text}")
-    elif response.status_code != 200:
-        raise BadRequestException(f"Error getting filling case detail by cnr: {response.status_code}: {response.text}")
-
-    try:
-        response.json()
-        raise NotFoundException("No case list found")
-    except (ValueError, KeyError) as e:
-        # If JSON parsing fails, assume it's encrypted data
-        pass
-
-    data = decrypt_response(response.text)
-    if isinstance(data, dict) and data.get('status') == 'N' and 'UnAuthorized' in str(data.get('Msg', '')):
-        raise UnauthorizedException("Token expired or invalid. Generate a new token from /auth/token")
-    logger.info(f"Default Case details retrieved by cnr: {data}")
+    logger.debug("Case list retrieved by cnr %s: %s", cnr, data)
     return data
@@ -1,145 +1,49 @@
 import logging
 import time
-import urllib.parse
 
-from httpx import Client
+from httpx import AsyncClient
 
+from scraper._common import ENGLISH_ONLY, _call
 from utils.cause_list_type import CauseListType
-from utils.constants import BASE_URL, DEVICE_ID
-from utils.crypto_utils import encrypt_request, decrypt_response
-from utils.exceptions import UnauthorizedException, BadRequestException, NotFoundException
+from utils.constants import APP_UID
+from utils.exceptions import BadRequestException
+
+__all__ = ["get_states", "get_districts", "get_court_complex", "get_court_name", "get_cause_list"]
 
 logger = logging.getLogger(__name__)
 
 
-def get_states(client: Client, token: str) -> dict:
+async def get_states(client: AsyncClient, token: str) -> dict:
     body = {'action_code': 'fillState', 'time': str(time.time())}
-    enc_body = encrypt_request(body)
-    encoded_body = urllib.parse.quote(enc_body)
-    
-    response = client.get(
-        f"{BASE_URL}/stateWebService.php?params={encoded_body}",
-        headers={'Authorization': f'Bearer {encrypt_request(token)}'}
-    )
-
-    if response.status_code in [401, 403]:
-        raise UnauthorizedException("Token expired or invalid")
-    elif response.status_code != 200:
-        raise BadRequestException(f"Error: {response.status_code}")
+    return await _call(client, token, "/stateWebService.php", body, "No data found", "Error getting states")
 
-    try:
-        response.json()
-        raise NotFoundException("No data found")
-    except (ValueError, KeyError):
-        pass
 
-    data = decrypt_response(response.text)
-    
-    if isinstance(data, dict) and data.get('status') == 'N' and 'UnAuthorized' in str(data.get('Msg', '')):
-        raise UnauthorizedException("Token expired or invalid. Generate a new token from /auth/token")
-    
-    return data
-
-
-def get_districts(client: Client, token: str, state_code: str) -> dict:
+async def get_districts(client: AsyncClient, token: str, state_code: str) -> dict:
     body = {'state_code': state_code, 'test_param': 'pending'}
-    enc_body = encrypt_request(body)
-    encoded_body = urllib.parse.quote(enc_body)
-    
-    response = client.get(
-        f"{BASE_URL}/districtWebService.php?params={encoded_body}",
-        headers={'Authorization': f'Bearer {encrypt_request(token)}'}
-    )
+    return await _call(client, token, "/districtWebService.php", body, "No data found", "Error getting districts")
 
-    if response.status_code in [401, 403]:
-        raise UnauthorizedException("Token expired or invalid")
-    elif response.status_code != 200:
-        raise BadRequestException(f"Error: {response.status_code}")
 
-    try:
-        response.json()
-        raise NotFoundException("No data found")
-    except (ValueError, KeyError):
-        pass
-
-    data = decrypt_response(response.text)
-    
-    if isinstance(data, dict) and data.get('status') == 'N' and 'UnAuthorized' in str(data.get('Msg', '')):
-        raise UnauthorizedException("Token expired or invalid. Generate a new token from /auth/token")
-    
-    return data
-
-
-def get_court_complex(client: Client, token: str, state_code: str, district_code: str) -> dict:
+async def get_court_complex(client: AsyncClient, token: str, state_code: str, district_code: str) -> dict:
     body = {
         'action_code': 'fillCourtComplex',
         'state_code': state_code,
         'dist_code': district_code
     }
-    enc_body = encrypt_request(body)
-    encoded_body = urllib.parse.quote(enc_body)
-    
-    response = client.get(
-        f"{BASE_URL}/courtEstWebService.php?params={encoded_body}",
-        headers={'Authorization': f'Bearer {encrypt_request(token)}'}
-    )
-
-    if response.status_code in [401, 403]:
-        raise UnauthorizedException("Token expired or invalid")
-    elif response.status_code != 200:
-        raise BadRequestException(f"Error: {response.status_code}")
-
-    try:
-        response.json()
-        raise NotFoundException("No data found")
-    except (ValueError, KeyError):
-        pass
-
-    data = decrypt_response(response.text)
-    
-    if isinstance(data, dict) and data.get('status') == 'N' and 'UnAuthorized' in str(data.get('Msg', '')):
-        raise UnauthorizedException("Token expired or invalid. Generate a new token from /auth/token")
-    
-    return data
+    return await _call(client, token, "/courtEstWebService.php", body, "No data found", "Error getting court complex")
 
 
-def get_court_name(client: Client, token: str, state_code: str, district_code: str, court_code: str) -> dict:
+async def get_court_name(client: AsyncClient, token: str, state_code: str, district_code: str, court_code: str) -> dict:
     body = {
         'state_code': state_code,
         'dist_code': district_code,
         'court_code': court_code,
-        'language_flag': 'english',
-        'bilingual_flag': '0'
+        **ENGLISH_ONLY
     }
-    enc_body = encrypt_request(body)
-    encoded_body = urllib.parse.quote(enc_body)
-    
-    response = client.get(
-        f"{BASE_URL}/courtNameWebService.php?params={encoded_body}",
-        headers={'Authorization': f'Bearer {encrypt_request(token)}'}
-    )
-
-    if response.status_code in [401, 403]:
-        raise UnauthorizedException("Token expired or invalid")
-    elif response.status_code != 200:
-        raise BadRequestException(f"Error: {response.status_code}")
+    return await _call(client, token, "/courtNameWebService.php", body, "No data found", "Error getting court names")
 
-    try:
-        response.json()
-        raise NotFoundException("No data found")
-    except (ValueError, KeyError):
-        pass
-
-    data = decrypt_response(response.text)
-    
-    if isinstance(data, dict) and data.get('status') == 'N' and 'UnAuthorized' in str(data.get('Msg', '')):
-        raise UnauthorizedException("Token expired or invalid. Generate a new token from /auth/token")
-    
-    return data
 
-
-def get_cause_list(
-        client: Client,
+async def get_cause_list(
+        client: AsyncClient,
         token: str,
         state_code: str,
         district_code: str,
@@ -158,37 +62,17 @@ def get_cause_list(
         'court_no': court_number,
         'court_code': court_code,
         'causelist_date': date,
-        'language_flag': 'english',
-        'bilingual_flag': '0',
-        'uid': f'{DEVICE_ID}:in.gov.ecourts.eCourtsServices'
+        **ENGLISH_ONLY,
+        'uid': APP_UID
     }
 
-    enc_body = encrypt_request(body)
-    encoded_body = urllib.parse.quote(enc_body)
-    response = client.get(
-        f"{BASE_URL}/cases_new.php?params={encoded_body}",
-        headers={
-            'Authorization': f'Bearer {encrypt_request(token)}'
-        }
-    )
-
-    if response.status_code == 401 or response.status_code == 403:
-        raise UnauthorizedException(f"Request unauthorised: {response.text}")
-    elif response.status_code != 200:
-        raise BadRequestException(f"Error getting cause list data: {response.status_code}: {response.text}")
-
     try:
-        response.json()
-        raise NotFoundException("No cause list data found")
-    except (ValueError, KeyError) as e:
-        # If JSON parsing fails, assume it's encrypted data
-        pass
-
-    try:
-        data = decrypt_response(response.text)
-        if isinstance(data, dict) and data.get('status') == 'N' and 'UnAuthorized' in str(data.get('Msg', '')):
-            raise UnauthorizedException("Token expired or invalid. Generate a new token from /auth/token")
-        logger.info(f"Cause list retrieved successfully: {data}")
-        return data
-    except(ValueError, KeyError) as e:
-        raise BadRequestException(f"You can only get 30 days of data: {response.status_code}: {response.text}")
+        data = await _call(
+            client, token, "/cases_new.php", body,
+            "No cause list data found", "Error getting cause list data"
+        )
+    except ValueError:
+        # The upstream answers out-of-range dates with a body that does not decrypt
+        raise BadRequestException("You can only get 30 days of data")
+    logger.debug("Cause list retrieved: %s", data)
+    return data
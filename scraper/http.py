@@ -0,0 +1,46 @@
+import os
+import httpx
+
+from utils.constants import BASE_URL
+
+# Built once as httpx.Headers so clients reuse the already-encoded header pairs.
+# No "Connection" header: it is HTTP/1-only and connection reuse is handled by the pool.
+HEADERS = httpx.Headers({
+    "Host": "app.ecourts.gov.in",
+    "User-Agent": "Dalvik/2.1.0 (Linux; U; Android 16; Pixel 7 Build/BP3A.250905.014)",
+    "Accept-Charset": "UTF-8",
+})
+
+# Upstream pool sizing; override through the environment without code changes
+MAX_CONNECTIONS = int(os.getenv("ECOURTS_MAX_CONN", "64"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("ECOURTS_KEEPALIVE", "32"))
+# Kept well under the upstream's idle timeout so we never reuse a socket it is closing
+KEEPALIVE_EXPIRY = float(os.getenv("ECOURTS_KEEPALIVE_EXPIRY", "15"))
+
+# Fail fast on connect and pool waits; the upstream can be slow to answer, not to accept
+TIMEOUT = httpx.Timeout(connect=5.0, read=15.0, write=5.0, pool=5.0)
+
+
+def create_client() -> httpx.AsyncClient:
+    """
+    Build the upstream client shared by every scraper call.
+
+    The API creates one per worker in its lifespan and closes it on shutdown.
+    """
+    # Every upstream call goes to a single host, so one HTTP/2 connection carries most traffic.
+    # No transport-level retries: scraper._common retries whole calls and counts the failures.
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers=HEADERS,
+        timeout=TIMEOUT,
+        follow_redirects=True,
+        transport=transport,
+    )
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from utils import cache
+from utils.cache import SingleFlight, TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    store = TTLCache(maxsize=10, ttl=30)
+    store.set("a", 1)
+
+    clock[0] += 29.9
+    assert store.get("a") == 1
+
+    clock[0] += 0.1
+    assert store.get("a") is None
+    assert store.get("missing") is None
+
+
+def test_oldest_entry_is_evicted_when_full(clock):
+    store = TTLCache(maxsize=2, ttl=30)
+    store.set("a", 1)
+    store.set("b", 2)
+    # Re-setting a key makes it the newest entry again
+    store.set("a", 3)
+    store.set("c", 4)
+
+    assert store.get("b") is None
+    assert store.get("a") == 3
+    assert store.get("c") == 4
+
+
+def test_concurrent_calls_share_one_run():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def run():
+        return await asyncio.gather(*(flight.do("key", fn) for _ in range(10)))
+
+    assert asyncio.run(run()) == ["value"] * 10
+    assert calls == 1
+    assert flight._in_flight == {}
+
+
+def test_exception_reaches_every_waiter_and_clears_key():
+    flight = SingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream failed")
+
+    async def run():
+        results = await asyncio.gather(*(flight.do("key", fn) for _ in range(3)), return_exceptions=True)
+        # Let the done callback run before checking the key is gone
+        await asyncio.sleep(0)
+        return results
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight._in_flight == {}
+
+
+def test_cancelled_waiter_does_not_cancel_shared_task():
+    flight = SingleFlight()
+    release = None
+
+    async def fn():
+        await release.wait()
+        return "value"
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        first = asyncio.create_task(flight.do("key", fn))
+        second = asyncio.create_task(flight.do("key", fn))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return first, await second
+
+    first, result = asyncio.run(run())
+
+    assert first.cancelled()
+    assert result == "value"
@@ -0,0 +1,86 @@
+import base64
+
+import orjson
+import pytest
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from utils import crypto_utils
+from utils.crypto_utils import decrypt_request, decrypt_response, encrypt_request
+
+# Encrypted with DECRYPTION_KEY, IV 00..0f and cryptography's own PKCS7 padder, so it does not
+# depend on the padding code under test
+KNOWN_RESPONSE = (
+    "000102030405060708090a0b0c0d0e0f"
+    "4YdwD/j1yvZJGBBfuWQ+DJ3R+UPEtdFd7zMsDilxJ2v2dOybEf7fgCxEqhVHnfi+qqWClozLYU2pUo/CPOLq0hp8r1/85ianQ64CNE5eHmA="
+)
+KNOWN_PAYLOAD = {"status": "Y", "token": "abc.def.ghi", "states": [{"code": 5, "name": "Delhi"}]}
+
+
+def raw_response(plaintext: bytes) -> str:
+    """A response whose plaintext is encrypted as-is, padding bytes included."""
+    iv = bytes(16)
+    encryptor = Cipher(algorithms.AES(crypto_utils.DECRYPTION_KEY), modes.CBC(iv)).encryptor()
+    ciphertext = encryptor.update(plaintext) + encryptor.finalize()
+    return iv.hex() + base64.b64encode(ciphertext).decode()
+
+
+@pytest.mark.parametrize("length", [0, 1, 15, 16, 17, 31, 32, 33])
+def test_cbc_round_trip_at_block_boundaries(length):
+    data = bytes(range(length))
+    iv = bytes(16)
+
+    ciphertext = crypto_utils._cbc_encrypt(crypto_utils._ENCRYPTION_ALGORITHM, iv, data)
+
+    # PKCS7 always adds padding, a whole block of it for aligned input
+    assert len(ciphertext) == (length // 16 + 1) * 16
+    assert bytes(crypto_utils._cbc_decrypt(crypto_utils._ENCRYPTION_ALGORITHM, iv, ciphertext)) == data
+
+
+@pytest.mark.parametrize("length", [2, 15, 16, 17])
+def test_request_round_trip(length):
+    # A JSON string of exactly `length` bytes, quotes included
+    payload = orjson.dumps("a" * (length - 2))
+    assert len(payload) == length
+
+    encrypted = encrypt_request(payload)
+
+    assert decrypt_request(encrypted) == "a" * (length - 2)
+    assert decrypt_request(encrypted.encode()) == "a" * (length - 2)
+
+
+def test_request_round_trip_of_dict():
+    body = {"cino": "DLHC010123452024", "language_flag": "english"}
+    assert decrypt_request(encrypt_request(body)) == body
+
+
+def test_decrypt_known_response():
+    assert decrypt_response(KNOWN_RESPONSE) == KNOWN_PAYLOAD
+    assert decrypt_response(KNOWN_RESPONSE.encode()) == KNOWN_PAYLOAD
+    assert decrypt_response(f"  {KNOWN_RESPONSE}\n") == KNOWN_PAYLOAD
+
+
+@pytest.mark.parametrize("plaintext", [
+    b"{}" + b"\x00" * 14,
+    b"{}" + b"\x11" * 14,
+    b"{}" + b"\x0d" * 11 + b"\x01\x03\x03",
+], ids=["pad-zero", "pad-17", "mismatched-tail"])
+def test_bad_padding_is_rejected(plaintext):
+    with pytest.raises(ValueError, match="padding"):
+        decrypt_response(raw_response(plaintext))
+
+
+def test_partial_block_is_rejected():
+    encrypted = bytes(16).hex() + base64.b64encode(bytes(20)).decode()
+    with pytest.raises(ValueError, match="whole number of blocks"):
+        decrypt_response(encrypted)
+
+
+@pytest.mark.parametrize("encrypted", ["", "abc", KNOWN_RESPONSE[:40]])
+def test_short_response_is_rejected(encrypted):
+    with pytest.raises(ValueError, match="too short"):
+        decrypt_response(encrypted)
+
+
+def test_malformed_request_is_rejected():
+    with pytest.raises(ValueError, match="Malformed"):
+        decrypt_request("0123456789abcdefX" + "A" * 24)
@@ -0,0 +1,119 @@
+import asyncio
+
+import httpx
+import pytest
+
+from scraper import _common
+from utils.exceptions import ServiceUnavailableException
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    """Fresh module breaker for each test, so failures do not leak between them."""
+    fresh = _common._CircuitBreaker(_common.BREAKER_FAIL_MAX, _common.BREAKER_RESET_TIMEOUT)
+    monkeypatch.setattr(_common, "_breaker", fresh)
+    return fresh
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of waiting them out."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(_common.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def send(handler) -> httpx.Response:
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(base_url="https://upstream.test", transport=transport) as client:
+            return await _common._send_with_retry(client, "/case.php", {}, "token")
+
+    return asyncio.run(run())
+
+
+def test_retries_until_success(breaker, sleeps):
+    statuses = iter([503, 503, 200])
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(next(statuses))
+
+    response = send(handler)
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+    assert breaker._failures == 0
+
+
+def test_long_retry_after_is_not_waited_out(breaker, sleeps):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, headers={"Retry-After": "5"})
+
+    with pytest.raises(ServiceUnavailableException) as excinfo:
+        send(handler)
+
+    assert excinfo.value.retry_after == 5.0
+    assert len(calls) == 1
+    assert sleeps == []
+    assert breaker._failures == 1
+
+
+def test_exhausted_retries_raise_service_unavailable(breaker, sleeps):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    with pytest.raises(ServiceUnavailableException) as excinfo:
+        send(handler)
+
+    assert excinfo.value.retry_after is None
+    assert len(calls) == _common.MAX_ATTEMPTS
+    assert breaker._failures == 1
+
+
+def test_connect_failure_raises_service_unavailable(breaker, sleeps):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    with pytest.raises(ServiceUnavailableException) as excinfo:
+        send(handler)
+
+    assert isinstance(excinfo.value.__cause__, httpx.ConnectError)
+    assert len(calls) == _common.MAX_ATTEMPTS
+    assert breaker._failures == 1
+
+
+def test_breaker_opens_and_resets(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_common.time, "monotonic", lambda: now[0])
+    breaker = _common._CircuitBreaker(fail_max=10, reset_timeout=30.0)
+
+    for _ in range(9):
+        breaker.record(False)
+    breaker.check()
+
+    breaker.record(False)
+    now[0] += 10.0
+    with pytest.raises(ServiceUnavailableException) as excinfo:
+        breaker.check()
+    assert excinfo.value.retry_after == pytest.approx(20.0)
+
+    now[0] += 20.0
+    breaker.check()
+    breaker.record(True)
+    assert breaker._failures == 0
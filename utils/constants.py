@@ -1,2 +1,3 @@
 DEVICE_ID="2fb280c3659303f1"
-BASE_URL="https://app.ecourts.gov.in/ecourt_mobile_DC"
\ No newline at end of file
+BASE_URL="https://app.ecourts.gov.in/ecourt_mobile_DC"
+APP_UID=f"{DEVICE_ID}:in.gov.ecourts.eCourtsServices"
@@ -1,8 +1,16 @@
-import base64
-import json
-import random
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
+import binascii
+import logging
+import os
+import platform
+import secrets
+from typing import Any
+
+import orjson
+import pybase64
+from cryptography.hazmat.backends.openssl import backend
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+logger = logging.getLogger(__name__)
 
 ENCRYPTION_KEY = bytes.fromhex('4D6251655468576D5A7134743677397A')
 DECRYPTION_KEY = bytes.fromhex('3273357638782F413F4428472B4B6250')
@@ -15,76 +23,116 @@ GLOBAL_IV_OPTIONS = [
     "614E645267556B58",
     "655368566D597133"
 ]
-
-
-def generate_random_hex(size):
-    return ''.join(random.choice('0123456789abcdef') for _ in range(size))
-
-
-def encrypt_request(data):
-    data_json = json.dumps(data, separators=(',', ':'))
-
-    global_index = random.randint(0, len(GLOBAL_IV_OPTIONS) - 1)
-    global_iv = GLOBAL_IV_OPTIONS[global_index]
-
-    random_iv = generate_random_hex(16)
-
-    full_iv_hex = global_iv + random_iv
-    iv = bytes.fromhex(full_iv_hex)
-
-    cipher = AES.new(ENCRYPTION_KEY, AES.MODE_CBC, iv)
-
-    padded_data = pad(data_json.encode('utf-8'), AES.block_size)
-    encrypted_data = cipher.encrypt(padded_data)
-
-    encrypted_base64 = base64.b64encode(encrypted_data).decode('utf-8')
+# Raw 8-byte halves of the IVs above, decoded once instead of on every call
+_GLOBAL_IV_PREFIXES = [bytes.fromhex(h) for h in GLOBAL_IV_OPTIONS]
+
+# The keys are fixed, so their algorithm objects are built once; OpenSSL does the block work
+_ENCRYPTION_ALGORITHM = algorithms.AES128(ENCRYPTION_KEY)
+_DECRYPTION_ALGORITHM = algorithms.AES128(DECRYPTION_KEY)
+_BLOCK_SIZE = 16
+# One ciphertext block is 24 base64 characters; anything shorter cannot be valid
+_MIN_RESPONSE_LENGTH = 32 + 24
+_MIN_REQUEST_LENGTH = 17 + 24
+
+
+def _cbc_encrypt(algorithm: algorithms.AES128, iv: bytes, data: bytes) -> bytes:
+    # PKCS7: always 1-16 bytes, each holding the pad length
+    pad_len = _BLOCK_SIZE - len(data) % _BLOCK_SIZE
+    encryptor = Cipher(algorithm, modes.CBC(iv)).encryptor()
+    return encryptor.update(data + bytes((pad_len,)) * pad_len) + encryptor.finalize()
+
+
+def _cbc_decrypt(algorithm: algorithms.AES128, iv: bytes, data: bytes) -> memoryview:
+    # Decrypt into one preallocated buffer and return a view of the unpadded part, so the
+    # plaintext is not copied again on its way to the JSON parser
+    if not data or len(data) % _BLOCK_SIZE:
+        raise ValueError("Ciphertext is not a whole number of blocks")
+    decryptor = Cipher(algorithm, modes.CBC(iv)).decryptor()
+    buffer = bytearray(len(data) + _BLOCK_SIZE - 1)
+    size = decryptor.update_into(data, buffer)
+    decryptor.finalize()
+    pad_len = buffer[size - 1] if size else 0
+    if not 1 <= pad_len <= _BLOCK_SIZE or buffer[size - pad_len:size] != buffer[size - 1:size] * pad_len:
+        raise ValueError("Invalid padding bytes.")
+    return memoryview(buffer)[:size - pad_len]
+
+
+def encrypt_request(data: Any) -> str:
+    # Pre-serialized JSON bytes go out as they are; anything else, including the bearer
+    # token string, is sent JSON-encoded
+    payload = data if isinstance(data, bytes) else orjson.dumps(data)
+
+    global_index = secrets.randbelow(len(_GLOBAL_IV_PREFIXES))
+    # IVs must be unpredictable, so the random half comes from the OS CSPRNG
+    random_iv = os.urandom(8)
+    iv = _GLOBAL_IV_PREFIXES[global_index] + random_iv
+
+    encrypted_data = _cbc_encrypt(_ENCRYPTION_ALGORITHM, iv, payload)
+
+    encrypted_base64 = pybase64.b64encode_as_string(encrypted_data)
 
     # Return: randomiv + globalIndex + encrypted_data
-    return random_iv + str(global_index) + encrypted_base64
+    return random_iv.hex() + str(global_index) + encrypted_base64
 
 
-def decrypt_response(encrypted_response):
+def decrypt_response(encrypted_response: str | bytes) -> Any:
+    # Accepts the raw response body as well, so callers can skip decoding it to str first
     try:
         encrypted_response = encrypted_response.strip()
+        if len(encrypted_response) < _MIN_RESPONSE_LENGTH:
+            raise ValueError("Encrypted response is too short")
         iv_hex = encrypted_response[:32]
-        iv = bytes.fromhex(iv_hex)
+        iv = binascii.unhexlify(iv_hex)
 
         encrypted_data_base64 = encrypted_response[32:]
-        encrypted_data = base64.b64decode(encrypted_data_base64)
-        cipher = AES.new(DECRYPTION_KEY, AES.MODE_CBC, iv)
-
-        decrypted_padded = cipher.decrypt(encrypted_data)
-        decrypted_data = unpad(decrypted_padded, AES.block_size)
+        encrypted_data = pybase64.b64decode(encrypted_data_base64, validate=False)
+        decrypted_data = _cbc_decrypt(_DECRYPTION_ALGORITHM, iv, encrypted_data)
 
-        plaintext = decrypted_data.decode('utf-8')
-        return json.loads(plaintext)
+        # orjson validates the UTF-8 itself, so the bytes are parsed without decoding first
+        return orjson.loads(decrypted_data)
     except Exception as e:
         raise ValueError(f"Decryption failed: {str(e)}")
 
 
-def decrypt_request(encrypted_request):
+def decrypt_request(encrypted_request: str | bytes) -> Any:
     try:
         encrypted_request = encrypted_request.strip()
+        if len(encrypted_request) < _MIN_REQUEST_LENGTH or not encrypted_request[16:17].isdigit():
+            raise ValueError("Malformed encrypted request")
 
         random_iv = encrypted_request[:16]
-        global_index = int(encrypted_request[16])
+        global_index = int(encrypted_request[16:17])
 
-        if global_index < 0 or global_index >= len(GLOBAL_IV_OPTIONS):
+        if global_index < 0 or global_index >= len(_GLOBAL_IV_PREFIXES):
             raise ValueError(f"Invalid global IV index: {global_index}")
 
         encrypted_data_base64 = encrypted_request[17:]
-        global_iv = GLOBAL_IV_OPTIONS[global_index]
-        full_iv_hex = global_iv + random_iv
-        iv = bytes.fromhex(full_iv_hex)
+        iv = _GLOBAL_IV_PREFIXES[global_index] + binascii.unhexlify(random_iv)
 
-        encrypted_data = base64.b64decode(encrypted_data_base64)
-        cipher = AES.new(ENCRYPTION_KEY, AES.MODE_CBC, iv)
+        encrypted_data = pybase64.b64decode(encrypted_data_base64, validate=False)
+        decrypted_data = _cbc_decrypt(_ENCRYPTION_ALGORITHM, iv, encrypted_data)
 
-        decrypted_padded = cipher.decrypt(encrypted_data)
-        decrypted_data = unpad(decrypted_padded, AES.block_size)
-
-        plaintext = decrypted_data.decode('utf-8')
-        return json.loads(plaintext)
+        # orjson validates the UTF-8 itself, so the bytes are parsed without decoding first
+        return orjson.loads(decrypted_data)
 
     except Exception as e:
         raise ValueError(f"Request decryption failed: {str(e)}")
+
+
+def _check_aes_acceleration() -> None:
+    """Warn once per worker when OpenSSL cannot use AES-NI, which makes crypto far slower."""
+    try:
+        if platform.system() != "Linux" or platform.machine() not in ("x86_64", "AMD64", "i686"):
+            return
+        with open("/proc/cpuinfo") as f:
+            flags = next((line for line in f if line.startswith("flags")), "").split()
+        if "aes" not in flags:
+            logger.warning(
+                "CPU does not report AES-NI; %s will fall back to slow software AES",
+                backend.openssl_version_text()
+            )
+    except Exception as e:
+        logger.debug("AES-NI check skipped: %s", e)
+
+
+_check_aes_acceleration()
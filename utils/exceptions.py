@@ -21,3 +21,11 @@ class BadRequestException(Exception):
 class InternalServerErrorException(Exception):
     """Raised when an internal server error occurs."""
     pass
+
+class ServiceUnavailableException(Exception):
+    """Raised when the upstream service is temporarily unavailable."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        # Seconds until the caller may try again, sent back as a Retry-After header
+        self.retry_after = retry_after